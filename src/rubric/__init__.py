@@ -1,3 +1,5 @@
+import asyncio
+
 from rubric.autograders.schemas import (
     CriterionEvaluation,
     OneShotOutput,
@@ -19,15 +21,43 @@ from rubric.types import (
     ToGradeInput,
 )
 from rubric.utils import (
+    aclose_client,
     compute_length_penalty,
+    compute_length_penalty_batch,
     default_oneshot_generate_fn,
     default_per_criterion_generate_fn,
     default_rubric_as_judge_generate_fn,
+    make_oneshot_generate_fn,
+    make_per_criterion_generate_fn,
+    make_rubric_as_judge_generate_fn,
+    make_tiktoken_count_fn,
     normalize_to_grade_input,
     parse_thinking_output,
+    reset_client,
     word_count,
 )
 
+
+def use_uvloop() -> bool:
+    """Install uvloop's event loop policy if uvloop is available.
+
+    uvloop roughly halves per-task event-loop overhead on Linux, which benefits
+    the one-coroutine-per-criterion fan-out in PerCriterionGrader. Call this
+    once before creating any event loop (i.e. before asyncio.run()).
+
+    Returns:
+        True if uvloop was installed as the loop policy, False if uvloop is
+        not available.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
 __version__ = "2.0.1"
 __all__ = [
     "CountFn",
@@ -40,12 +70,20 @@ __all__ = [
     "Rubric",
     "ThinkingOutputDict",
     "ToGradeInput",
+    "aclose_client",
     "compute_length_penalty",
+    "compute_length_penalty_batch",
     "default_oneshot_generate_fn",
     "default_per_criterion_generate_fn",
     "default_rubric_as_judge_generate_fn",
+    "make_oneshot_generate_fn",
+    "make_per_criterion_generate_fn",
+    "make_rubric_as_judge_generate_fn",
+    "make_tiktoken_count_fn",
     "normalize_to_grade_input",
     "parse_thinking_output",
+    "reset_client",
+    "use_uvloop",
     "word_count",
     "PerCriterionGenerateFn",
     "OneShotGenerateFn",
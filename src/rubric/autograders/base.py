@@ -1,6 +1,9 @@
 """Shared abstractions for autograder implementations."""
 
+import asyncio
+import hashlib
 from abc import ABC, abstractmethod
+from collections.abc import MutableMapping, Sequence
 from typing import Any
 
 from rubric.types import Criterion, EvaluationReport, LengthPenalty, ToGradeInput
@@ -20,6 +23,18 @@ class Autograder(ABC):
             final score.
         normalize: If True (default), scores are normalized to 0-1. If False, raw weighted
             sums are returned, which is useful for RL training scenarios.
+        max_concurrency: Maximum number of in-flight generate_fn calls across all grading
+            done through this autograder. Bounds the fan-out when many criteria (or many
+            submissions) are graded concurrently, so requests queue here instead of
+            saturating the HTTP client's connection pool.
+        cache: Optional mapping used to memoize grade() results keyed by
+            (submission digest, rubric, query). Re-grading an identical submission
+            against the same rubric (retries, ablations, cross-validation) then skips
+            the LLM calls entirely. Pass a plain dict, functools.lru_cache-style
+            wrapper, or a disk-backed mapping such as diskcache.Cache. Hits return
+            the stored EvaluationReport instance itself; reports are frozen and
+            hold their per-criterion breakdown in a tuple, so the shared
+            instance cannot be mutated under the cache.
     """
 
     def __init__(
@@ -27,9 +42,28 @@ class Autograder(ABC):
         *,
         length_penalty: LengthPenalty | None = None,
         normalize: bool = True,
+        max_concurrency: int = 32,
+        cache: MutableMapping[tuple, EvaluationReport] | None = None,
     ):
         self.length_penalty: LengthPenalty | None = length_penalty
         self.normalize: bool = normalize
+        self.max_concurrency: int = max_concurrency
+        self.cache: MutableMapping[tuple, EvaluationReport] | None = cache
+        self._semaphore: asyncio.Semaphore | None = None
+        self._semaphore_loop: asyncio.AbstractEventLoop | None = None
+
+    def _concurrency_limiter(self) -> asyncio.Semaphore:
+        """Return the semaphore bounding concurrent generate_fn calls.
+
+        Created lazily inside the running event loop (and recreated if the loop
+        changes, e.g. across separate asyncio.run() invocations) so one autograder
+        instance can be reused safely.
+        """
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphore_loop = loop
+        return self._semaphore
 
     @abstractmethod
     async def judge(self, to_grade: str, rubric: list[Criterion], query: str | None = None) -> Any:
@@ -89,6 +123,14 @@ class Autograder(ABC):
                 parts.append(f"<output>{output}</output>")
             to_grade_str = "\n".join(parts) if parts else ""
 
+        # Check the cache before spending any LLM calls
+        cache_key: tuple | None = None
+        if self.cache is not None:
+            cache_key = self._cache_key(to_grade_str, rubric, query)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         # Call judge with string format (maintains compatibility)
         judge_results = await self.judge(to_grade_str, rubric, query)
         report = await self.aggregate(judge_results, normalize=self.normalize)
@@ -104,8 +146,84 @@ class Autograder(ABC):
             adjusted_score = report.score + penalty if penalty < 0 else report.score - penalty
             if self.normalize:
                 adjusted_score = max(0.0, adjusted_score)
-            return EvaluationReport(
+            report = EvaluationReport.model_construct(
                 score=adjusted_score, raw_score=report.raw_score, report=report.report
             )
 
+        if self.cache is not None and cache_key is not None:
+            self.cache[cache_key] = report
+
         return report
+
+    async def grade_many(
+        self,
+        items: Sequence[tuple],
+        *,
+        concurrency: int = 32,
+    ) -> list[EvaluationReport]:
+        """Grade a batch of submissions concurrently with bounded fan-out.
+
+        First-class replacement for hand-rolled asyncio.gather loops, which tend
+        to create one task per submission with no limit and exhaust the HTTP
+        client's connection pool. All grading shares this autograder's client,
+        cache, and generate-level semaphore.
+
+        Args:
+            items: Sequence of (to_grade, rubric) or (to_grade, rubric, query)
+                tuples, each matching the grade() signature.
+            concurrency: Maximum number of submissions graded at once. The
+                per-call fan-out inside each grade() is still bounded separately
+                by max_concurrency.
+
+        Returns:
+            EvaluationReports in the same order as items.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _grade_one(item: tuple) -> EvaluationReport:
+            async with semaphore:
+                return await self.grade(*item)
+
+        return list(await asyncio.gather(*(_grade_one(item) for item in items)))
+
+    def _cache_key(self, to_grade_str: str, rubric: list[Criterion], query: str | None) -> tuple:
+        """Build the cache key for one (submission, rubric, query) grading call.
+
+        The submission is digested so long texts don't keep full copies alive
+        as dictionary keys. The grader configuration is fingerprinted into the
+        key so a mapping shared between graders (or persisted on disk) can't
+        serve reports produced under a different grader class, system prompt,
+        normalize setting, or length penalty.
+        """
+        return (
+            self._config_fingerprint(),
+            hashlib.blake2b(to_grade_str.encode(), digest_size=16).digest(),
+            tuple((criterion.weight, criterion.requirement) for criterion in rubric),
+            query,
+        )
+
+    def _config_fingerprint(self) -> tuple:
+        """Fingerprint the grading configuration that shapes cache entries.
+
+        Covers the grader class, system prompt (digested), normalize flag, and
+        length-penalty parameters. Callables — generate_fn (and thus the model
+        behind it) and a custom count_fn — have no stable cross-process
+        identity and are not fingerprinted: use separate caches for graders
+        that differ only in those.
+        """
+        penalty = self.length_penalty
+        system_prompt: str = getattr(self, "system_prompt", "")
+        return (
+            type(self).__qualname__,
+            hashlib.blake2b(system_prompt.encode(), digest_size=16).digest(),
+            self.normalize,
+            (
+                penalty.free_budget,
+                penalty.max_cap,
+                penalty.penalty_at_cap,
+                penalty.exponent,
+                penalty.penalty_type,
+            )
+            if penalty is not None
+            else None,
+        )
@@ -1,14 +1,22 @@
 """Per Criterion grader evaluates each criterion separately in parallel LLM calls."""
 
 import asyncio
+from collections.abc import MutableMapping
+
+import numpy as np
 
 from rubric.autograders import Autograder
+from rubric.autograders.per_criterion_one_shot_grader import (
+    DEFAULT_SYSTEM_PROMPT as ONESHOT_DEFAULT_SYSTEM_PROMPT,
+)
+from rubric.autograders.per_criterion_one_shot_grader import PerCriterionOneShotGrader
 from rubric.autograders.schemas import PerCriterionOutput
 from rubric.types import (
     Criterion,
     CriterionReport,
     EvaluationReport,
     LengthPenalty,
+    OneShotGenerateFn,
     PerCriterionGenerateFn,
 )
 
@@ -127,9 +135,35 @@ class PerCriterionGrader(Autograder):
     Args:
         generate_fn: Typed generate function that returns validated PerCriterionOutput.
             Users handle parsing, validation, and retries in their implementation.
-        system_prompt: System prompt for criterion evaluation.
+        system_prompt: System prompt for the per-criterion calls. It is not used on
+            the one-shot path; see oneshot_system_prompt.
         length_penalty: Optional length penalty configuration.
         normalize: If True (default), normalize scores to 0-1.
+        max_concurrency: Maximum number of in-flight generate_fn calls for this grader.
+        cache: Optional mapping memoizing grade() results; see Autograder.
+        oneshot_generate_fn: Optional typed generate function that returns validated
+            OneShotOutput. When provided, rubrics with at least auto_batch_threshold
+            criteria are judged in a single one-shot LLM call instead of one call per
+            criterion, collapsing N request latencies into one. That call uses
+            oneshot_system_prompt, not system_prompt.
+        oneshot_system_prompt: System prompt for the one-shot call when the auto-batch
+            path is taken. Defaults to PerCriterionOneShotGrader's prompt; the
+            single-criterion system_prompt is not reused because the one-shot call
+            expects all criteria in one request and a different output schema.
+        auto_batch_threshold: Minimum number of criteria before the one-shot path is
+            used. Ignored unless oneshot_generate_fn is provided. The one-shot path
+            takes precedence over score_threshold: once a rubric auto-batches into
+            a single LLM call there are no in-flight per-criterion calls left to
+            cancel, so no early termination happens on that path.
+        score_threshold: Optional normalized (0-1) score cutoff enabling early
+            termination. When set, criterion results are consumed as they complete
+            and the remaining in-flight LLM calls are cancelled as soon as the
+            outcome relative to the threshold can no longer change. Criteria that
+            were cancelled appear in the report as UNMET with an explanatory
+            reason; the pass/fail decision versus the threshold is unaffected.
+            Only applies on the per-criterion fan-out path: rubrics that
+            auto-batch through oneshot_generate_fn are judged in one call and
+            ignore this setting.
     """
 
     def __init__(
@@ -139,10 +173,34 @@ class PerCriterionGrader(Autograder):
         system_prompt: str = DEFAULT_SYSTEM_PROMPT,
         length_penalty: LengthPenalty | None = None,
         normalize: bool = True,
+        max_concurrency: int = 32,
+        cache: MutableMapping[tuple, EvaluationReport] | None = None,
+        oneshot_generate_fn: OneShotGenerateFn | None = None,
+        oneshot_system_prompt: str = ONESHOT_DEFAULT_SYSTEM_PROMPT,
+        auto_batch_threshold: int = 4,
+        score_threshold: float | None = None,
     ):
-        super().__init__(length_penalty=length_penalty, normalize=normalize)
+        super().__init__(
+            length_penalty=length_penalty,
+            normalize=normalize,
+            max_concurrency=max_concurrency,
+            cache=cache,
+        )
         self.generate_fn = generate_fn
         self.system_prompt = system_prompt
+        self.auto_batch_threshold = auto_batch_threshold
+        self.score_threshold = score_threshold
+        self._oneshot_grader = (
+            PerCriterionOneShotGrader(
+                generate_fn=oneshot_generate_fn,
+                system_prompt=oneshot_system_prompt,
+                length_penalty=length_penalty,
+                normalize=normalize,
+                max_concurrency=max_concurrency,
+            )
+            if oneshot_generate_fn is not None
+            else None
+        )
 
     async def _judge_single_criterion(
         self, criterion: Criterion, to_grade: str, query: str | None = None
@@ -163,12 +221,16 @@ class PerCriterionGrader(Autograder):
 {to_grade}
 </response>"""
 
-        # Call generate_fn - user handles validation and retries
-        result: PerCriterionOutput = await self.generate_fn(
-            system_prompt=self.system_prompt, user_prompt=user_prompt
-        )
+        # Call generate_fn - user handles validation and retries. The shared
+        # semaphore bounds fan-out across everything graded through this instance.
+        async with self._concurrency_limiter():
+            result: PerCriterionOutput = await self.generate_fn(
+                system_prompt=self.system_prompt, user_prompt=user_prompt
+            )
 
-        return CriterionReport(
+        # Every field comes from an already-validated PerCriterionOutput or the
+        # rubric itself, so skip a second validation pass over our own data.
+        return CriterionReport.model_construct(
             requirement=criterion.requirement,
             verdict=result.criterion_status,
             reason=result.explanation,
@@ -178,21 +240,106 @@ class PerCriterionGrader(Autograder):
     async def judge(
         self, to_grade: str, rubric: list[Criterion], query: str | None = None
     ) -> list[CriterionReport]:
+        # Auto-batch takes precedence over score_threshold: a single one-shot
+        # call leaves no per-criterion tasks to cancel early.
+        if self._oneshot_grader is not None and len(rubric) >= self.auto_batch_threshold:
+            return await self._oneshot_grader.judge(to_grade, rubric, query)
+
+        if self.score_threshold is not None:
+            return await self._judge_with_threshold(to_grade, rubric, query)
+
         criterion_tasks = [
             self._judge_single_criterion(criterion, to_grade, query) for criterion in rubric
         ]
         return list(await asyncio.gather(*criterion_tasks))
 
+    async def _judge_with_threshold(
+        self, to_grade: str, rubric: list[Criterion], query: str | None = None
+    ) -> list[CriterionReport]:
+        """Judge criteria as they complete and stop once the threshold outcome is decided.
+
+        The weighted sum is accumulated incrementally; when the score can no longer
+        cross (or fall back under) score_threshold regardless of the pending
+        criteria, those in-flight calls are cancelled and reported as UNMET. The
+        UNMET placeholder contributes zero weight either way, so the decision
+        relative to the threshold is preserved.
+        """
+        threshold = self.score_threshold
+        total_positive = sum(max(0.0, criterion.weight) for criterion in rubric)
+        remaining_negative = sum(-min(0.0, criterion.weight) for criterion in rubric)
+        if threshold is None or total_positive <= 0:
+            # Threshold semantics are defined against the positive-weight
+            # normalization; fall back to plain fan-out otherwise.
+            return list(
+                await asyncio.gather(
+                    *(self._judge_single_criterion(c, to_grade, query) for c in rubric)
+                )
+            )
+
+        tasks = [
+            asyncio.ensure_future(self._judge_single_criterion(criterion, to_grade, query))
+            for criterion in rubric
+        ]
+        index_of = {task: index for index, task in enumerate(tasks)}
+        reports: list[CriterionReport | None] = [None] * len(rubric)
+        weighted_sum = 0.0
+        remaining_positive = total_positive
+        pending: set[asyncio.Future] = set(tasks)
+
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    index = index_of[task]
+                    report = task.result()
+                    reports[index] = report
+                    if report.verdict == "MET":
+                        weighted_sum += report.weight
+                    if report.weight > 0:
+                        remaining_positive -= report.weight
+                    else:
+                        remaining_negative -= -report.weight
+
+                max_possible = (weighted_sum + remaining_positive) / total_positive
+                min_possible = (weighted_sum - remaining_negative) / total_positive
+                if pending and (max_possible < threshold or min_possible >= threshold):
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        for index, report in enumerate(reports):
+            if report is None:
+                reports[index] = CriterionReport.model_construct(
+                    requirement=rubric[index].requirement,
+                    verdict="UNMET",
+                    reason="Not evaluated: remaining criteria could not change the "
+                    "score threshold outcome",
+                    weight=rubric[index].weight,
+                )
+
+        return reports  # type: ignore[return-value]
+
     async def aggregate(
         self, judge_results: list[CriterionReport], *, normalize: bool = True
     ) -> EvaluationReport:
-        total_positive_weight = sum(max(0.0, report.weight) for report in judge_results)
-        total_negative_weight = sum(
-            abs(report.weight) for report in judge_results if report.weight < 0
+        # Vectorized: one pass to build the weight/verdict arrays, then the
+        # totals and the weighted sum are NumPy reductions instead of Python
+        # loops, which matters for rubrics with hundreds of criteria.
+        count = len(judge_results)
+        weights = np.fromiter(
+            (report.weight for report in judge_results), dtype=np.float64, count=count
         )
-        weighted_score_sum = sum(
-            (1.0 if report.verdict == "MET" else 0.0) * report.weight for report in judge_results
+        verdicts = np.fromiter(
+            (1.0 if report.verdict == "MET" else 0.0 for report in judge_results),
+            dtype=np.float64,
+            count=count,
         )
+        total_positive_weight = float(np.clip(weights, 0.0, None).sum())
+        total_negative_weight = float(-np.clip(weights, None, 0.0).sum())
+        weighted_score_sum = float(weights @ verdicts)
 
         raw_score = weighted_score_sum
 
@@ -210,9 +357,9 @@ class PerCriterionGrader(Autograder):
         else:
             score = raw_score
 
-        return EvaluationReport(
+        return EvaluationReport.model_construct(
             score=score,
             raw_score=raw_score,
             llm_raw_score=raw_score,  # Same as raw_score for per-criterion graders
-            report=judge_results,
+            report=tuple(judge_results),
         )
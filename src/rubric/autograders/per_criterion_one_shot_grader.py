@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+from collections.abc import MutableMapping
+
+import numpy as np
+
 from rubric.autograders import Autograder
 from rubric.autograders.schemas import OneShotOutput
 from rubric.types import (
@@ -97,6 +101,8 @@ class PerCriterionOneShotGrader(Autograder):
         system_prompt: System prompt for one-shot evaluation.
         length_penalty: Optional length penalty configuration.
         normalize: If True (default), normalize scores to 0-1.
+        max_concurrency: Maximum number of in-flight generate_fn calls for this grader.
+        cache: Optional mapping memoizing grade() results; see Autograder.
     """
 
     def __init__(
@@ -106,8 +112,15 @@ class PerCriterionOneShotGrader(Autograder):
         system_prompt: str = DEFAULT_SYSTEM_PROMPT,
         length_penalty: LengthPenalty | None = None,
         normalize: bool = True,
+        max_concurrency: int = 32,
+        cache: MutableMapping[tuple, EvaluationReport] | None = None,
     ):
-        super().__init__(length_penalty=length_penalty, normalize=normalize)
+        super().__init__(
+            length_penalty=length_penalty,
+            normalize=normalize,
+            max_concurrency=max_concurrency,
+            cache=cache,
+        )
         self.generate_fn = generate_fn
         self.system_prompt = system_prompt
 
@@ -142,7 +155,8 @@ class PerCriterionOneShotGrader(Autograder):
 Provide your evaluation as JSON only."""
 
         # Call generate_fn - user handles validation and retries
-        result: OneShotOutput = await self.generate_fn(self.system_prompt, user_prompt)
+        async with self._concurrency_limiter():
+            result: OneShotOutput = await self.generate_fn(self.system_prompt, user_prompt)
 
         # Create a mapping from criterion_number to evaluation
         evaluation_map = {
@@ -154,9 +168,11 @@ Provide your evaluation as JSON only."""
         for index, criterion in enumerate(rubric, start=1):
             eval_item = evaluation_map.get(index)
 
+            # Fields come from the already-validated OneShotOutput or the rubric
+            # itself, so skip a second validation pass over our own data.
             if eval_item:
                 criterion_reports.append(
-                    CriterionReport(
+                    CriterionReport.model_construct(
                         requirement=criterion.requirement,
                         verdict=eval_item.criterion_status,
                         reason=eval_item.explanation,
@@ -166,7 +182,7 @@ Provide your evaluation as JSON only."""
             else:
                 # Evaluation missing for this criterion number
                 criterion_reports.append(
-                    CriterionReport(
+                    CriterionReport.model_construct(
                         requirement=criterion.requirement,
                         verdict="UNMET",
                         reason="Evaluation not found in response",
@@ -179,13 +195,21 @@ Provide your evaluation as JSON only."""
     async def aggregate(
         self, judge_results: list[CriterionReport], *, normalize: bool = True
     ) -> EvaluationReport:
-        total_positive_weight = sum(max(0.0, report.weight) for report in judge_results)
-        total_negative_weight = sum(
-            abs(report.weight) for report in judge_results if report.weight < 0
+        # Vectorized: one pass to build the weight/verdict arrays, then the
+        # totals and the weighted sum are NumPy reductions instead of Python
+        # loops, which matters for rubrics with hundreds of criteria.
+        count = len(judge_results)
+        weights = np.fromiter(
+            (report.weight for report in judge_results), dtype=np.float64, count=count
         )
-        weighted_score_sum = sum(
-            (1.0 if report.verdict == "MET" else 0.0) * report.weight for report in judge_results
+        verdicts = np.fromiter(
+            (1.0 if report.verdict == "MET" else 0.0 for report in judge_results),
+            dtype=np.float64,
+            count=count,
         )
+        total_positive_weight = float(np.clip(weights, 0.0, None).sum())
+        total_negative_weight = float(-np.clip(weights, None, 0.0).sum())
+        weighted_score_sum = float(weights @ verdicts)
 
         raw_score = weighted_score_sum
 
@@ -203,9 +227,9 @@ Provide your evaluation as JSON only."""
         else:
             score = raw_score
 
-        return EvaluationReport(
+        return EvaluationReport.model_construct(
             score=score,
             raw_score=raw_score,
             llm_raw_score=raw_score,  # Same as raw_score for per-criterion graders
-            report=judge_results,
+            report=tuple(judge_results),
         )
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import MutableMapping
+
 from rubric.autograders import Autograder
 from rubric.autograders.schemas import RubricAsJudgeOutput
 from rubric.types import (
@@ -89,6 +91,8 @@ class RubricAsJudgeGrader(Autograder):
         system_prompt: System prompt for holistic evaluation.
         length_penalty: Optional length penalty configuration.
         normalize: If True (default), normalize scores to 0-1.
+        max_concurrency: Maximum number of in-flight generate_fn calls for this grader.
+        cache: Optional mapping memoizing grade() results; see Autograder.
     """
 
     def __init__(
@@ -98,8 +102,15 @@ class RubricAsJudgeGrader(Autograder):
         system_prompt: str = DEFAULT_SYSTEM_PROMPT,
         length_penalty: LengthPenalty | None = None,
         normalize: bool = True,
+        max_concurrency: int = 32,
+        cache: MutableMapping[tuple, EvaluationReport] | None = None,
     ):
-        super().__init__(length_penalty=length_penalty, normalize=normalize)
+        super().__init__(
+            length_penalty=length_penalty,
+            normalize=normalize,
+            max_concurrency=max_concurrency,
+            cache=cache,
+        )
         self.generate_fn = generate_fn
         self.system_prompt = system_prompt
 
@@ -147,7 +158,8 @@ using the logic from the system prompt, and return a single holistic score from
 Return your evaluation as JSON only."""
 
         # Call generate_fn - user handles validation and retries
-        result: RubricAsJudgeOutput = await self.generate_fn(self.system_prompt, user_prompt)
+        async with self._concurrency_limiter():
+            result: RubricAsJudgeOutput = await self.generate_fn(self.system_prompt, user_prompt)
 
         return {
             "llm_score": result.overall_score,
@@ -185,7 +197,7 @@ Return your evaluation as JSON only."""
         else:
             score = raw_score
 
-        return EvaluationReport(
+        return EvaluationReport.model_construct(
             score=score,
             raw_score=raw_score,
             llm_raw_score=llm_raw_score,
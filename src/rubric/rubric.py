@@ -7,20 +7,49 @@ from typing import Any
 import yaml
 from pydantic import ValidationError
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
 from rubric.autograders import Autograder, PerCriterionGrader
 from rubric.types import Criterion, EvaluationReport, ToGradeInput
 from rubric.utils import default_per_criterion_generate_fn
 
 
+def _loads_json(content: str | bytes) -> Any:
+    """Parse JSON, using orjson's Rust parser when installed.
+
+    orjson is several times faster than stdlib json on the nested
+    dict-of-dicts shape of large rubric files; its JSONDecodeError is a
+    ValueError subclass, so callers can catch ValueError for both parsers.
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
 class Rubric:
     """A rubric is a list of criteria used to evaluate text outputs.
 
     Each criterion has a weight and requirement. Use the grade() method
     to evaluate text against this rubric using different autograder strategies.
+
+    Weight totals are precomputed once at construction (criteria are frozen, so
+    they cannot change afterwards) rather than re-derived on every grading call:
+
+    Attributes:
+        rubric: The list of criteria.
+        total_positive_weight: Sum of all positive criterion weights; the
+            denominator used when normalizing scores to 0-1.
+        total_negative_weight: Sum of the magnitudes of all negative criterion
+            weights.
     """
 
     def __init__(self, rubric: list[Criterion]):
         self.rubric = rubric
+        self.total_positive_weight = sum(c.weight for c in rubric if c.weight > 0)
+        self.total_negative_weight = sum(-c.weight for c in rubric if c.weight < 0)
 
     async def grade(
         self,
@@ -110,7 +139,8 @@ class Rubric:
                 )
 
             try:
-                criteria.append(Criterion(**criterion_data))  # type: ignore[arg-type]
+                criterion = Criterion(**criterion_data)  # type: ignore[arg-type]
+                criteria.append(Criterion.intern(criterion.weight, criterion.requirement))
             except ValidationError as e:
                 error_details = []
                 for error in e.errors():
@@ -139,8 +169,8 @@ class Rubric:
     def from_json(cls, json_string: str) -> "Rubric":
         """Parse rubric from a JSON string."""
         try:
-            data = json.loads(json_string)
-        except json.JSONDecodeError as e:
+            data = _loads_json(json_string)
+        except ValueError as e:
             raise ValueError(f"Failed to parse JSON string: {e}") from e
 
         criteria = cls.validate_and_create_criteria(data)
@@ -173,8 +203,8 @@ class Rubric:
                 return cls(criteria)
             elif extension == ".json":
                 try:
-                    data = json.loads(content)
-                except json.JSONDecodeError as e:
+                    data = _loads_json(content)
+                except ValueError as e:
                     raise ValueError(f"Failed to parse JSON from file object: {e}") from e
                 criteria = cls.validate_and_create_criteria(data)
                 return cls(criteria)
@@ -201,10 +231,10 @@ class Rubric:
                 criteria = cls.validate_and_create_criteria(data)
                 return cls(criteria)
             elif extension == ".json":
-                with open(source) as f:
+                with open(source, "rb") as f:
                     try:
-                        data = json.load(f)
-                    except json.JSONDecodeError as e:
+                        data = _loads_json(f.read())
+                    except ValueError as e:
                         raise ValueError(f"Failed to parse JSON file: {e}") from e
                 criteria = cls.validate_and_create_criteria(data)
                 return cls(criteria)
@@ -1,5 +1,6 @@
 """Type definitions for rubrics and evaluation components."""
 
+import weakref
 from collections.abc import Callable
 from typing import Any, Literal, Protocol, TypedDict
 
@@ -99,14 +100,49 @@ class LengthPenalty(BaseModel):
     penalty_type: PenaltyType = "ALL"
 
 
+_criterion_intern: "weakref.WeakValueDictionary[tuple[float, str], Criterion]" = (
+    weakref.WeakValueDictionary()
+)
+"""Canonical Criterion instances keyed by (weight, requirement), see Criterion.intern.
+
+Weak-valued so a long-running service parsing many distinct rubrics doesn't
+leak registry entries: a canonical instance is dropped automatically once no
+rubric references it.
+"""
+
+
 class Criterion(BaseModel):
-    """A single evaluation criterion with a weight and requirement description."""
+    """A single evaluation criterion with a weight and requirement description.
+
+    Criteria are frozen, so pydantic generates __eq__ and __hash__ from the
+    field values and instances can be used directly as dict/set keys (e.g. in
+    autograder caches).
+    """
 
     model_config = ConfigDict(frozen=True)
 
     weight: float
     requirement: str
 
+    @classmethod
+    def intern(cls, weight: float, requirement: str) -> "Criterion":
+        """Return the canonical Criterion for this (weight, requirement) pair.
+
+        Shared criterion libraries repeat the same criteria across many
+        rubrics; interning makes those rubrics share one instance per distinct
+        criterion, so they occupy memory once and hit the same autograder
+        cache entries. Rubric construction interns automatically. The registry
+        holds its values weakly, so criteria referenced by no rubric don't
+        accumulate.
+        """
+        key = (weight, requirement)
+        criterion = _criterion_intern.get(key)
+        if criterion is None:
+            criterion = _criterion_intern.setdefault(
+                key, cls(weight=weight, requirement=requirement)
+            )
+        return criterion
+
 
 class CriterionReport(Criterion):
     """A criterion with its evaluation verdict (MET/UNMET) and reasoning."""
@@ -121,6 +157,12 @@ class EvaluationReport(BaseModel):
     For training use cases, set normalize=False in the autograder to get raw weighted sums
     instead of normalized 0-1 scores.
 
+    Reports are frozen and the per-criterion breakdown is stored as a tuple:
+    autograder caches hand the same instance to every cache hit, so in-place
+    mutation (attribute assignment or editing the report sequence) would
+    silently corrupt later results. Use model_copy(update={...}) to derive a
+    modified report.
+
     Attributes:
         score: The final score (0-1 if normalized, raw weighted sum otherwise).
         raw_score: Always contains the unnormalized weighted sum, regardless of grader type.
@@ -132,10 +174,12 @@ class EvaluationReport(BaseModel):
         report: Optional per-criterion breakdown (None for RubricAsJudgeGrader).
     """
 
+    model_config = ConfigDict(frozen=True)
+
     score: float
     raw_score: float | None = None
     llm_raw_score: float | None = None
-    report: list[CriterionReport] | None = None
+    report: tuple[CriterionReport, ...] | None = None
 
 
 class PerCriterionGenerateFn(Protocol):
@@ -1,21 +1,112 @@
+from __future__ import annotations
+
+import importlib.util
 import os
 import re
 import warnings
+from collections.abc import Sequence
+from functools import cache
+from typing import TYPE_CHECKING
+
+import numpy as np
+from pydantic import BaseModel, TypeAdapter
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_random_exponential
 
-from google import genai
-from google.genai import types
+if TYPE_CHECKING:
+    from google import genai
+    from google.genai import types
 
 from rubric.autograders.schemas import (
     OneShotOutput,
     PerCriterionOutput,
     RubricAsJudgeOutput,
 )
-from rubric.types import LengthPenalty, ThinkingOutputDict, ToGradeInput
+from rubric.types import (
+    CountFn,
+    LengthPenalty,
+    OneShotGenerateFn,
+    PerCriterionGenerateFn,
+    RubricAsJudgeGenerateFn,
+    ThinkingOutputDict,
+    ToGradeInput,
+)
+
+_client: genai.Client | None = None
+
+_DEFAULT_MAX_CONNECTIONS = 2000
+"""Default connection-pool size; override via RUBRIC_HTTP_MAX_CONNECTIONS."""
+
+
+def _http_options() -> types.HttpOptions:
+    """Build HTTP options with a connection pool sized for concurrent grading.
+
+    httpx defaults to max_connections=100, which saturates when PerCriterionGrader
+    fans out many criteria concurrently across a batch; calls then queue on the
+    client instead of at the API. Set RUBRIC_HTTP_MAX_CONNECTIONS to match your
+    API rate-limit tier.
+
+    When the optional h2 package is installed, HTTP/2 is enabled so the many
+    small concurrent criterion requests multiplex over one TCP+TLS session
+    instead of each occupying a pooled connection.
+    """
+    import httpx
+    from google.genai import types
+
+    max_connections = int(os.getenv("RUBRIC_HTTP_MAX_CONNECTIONS", _DEFAULT_MAX_CONNECTIONS))
+    client_args = {
+        "limits": httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max(1, max_connections * 3 // 4),
+            keepalive_expiry=30.0,
+        ),
+        "timeout": httpx.Timeout(120.0),
+        "http2": importlib.util.find_spec("h2") is not None,
+    }
+    return types.HttpOptions(client_args=client_args, async_client_args=dict(client_args))
+
+
+def _get_client() -> genai.Client:
+    """Return the shared Gemini client, constructing it on first use.
+
+    Creating a client per call sets up a fresh HTTP connection pool each time,
+    forcing a new TCP+TLS handshake on every grading call. Reusing one client
+    keeps connections alive across calls.
+    """
+    global _client
+    if _client is None:
+        from google import genai
+
+        _client = genai.Client(api_key=os.getenv("GEMINI_API_KEY"), http_options=_http_options())
+    return _client
+
+
+def reset_client() -> None:
+    """Discard the shared Gemini client so the next call constructs a fresh one.
+
+    Useful for test isolation or after changing GEMINI_API_KEY.
+    """
+    global _client
+    _client = None
+
+
+async def aclose_client() -> None:
+    """Close the shared Gemini client's connections and reset it.
+
+    Call this at shutdown to release the connection pool cleanly.
+    """
+    global _client
+    if _client is not None:
+        await _client.aio.aclose()
+        _client = None
 
 
 def word_count(text: str) -> int:
     """Count the number of whitespace-separated words in text.
 
+    str.split() runs as a single C pass and its word list is transient, which
+    benchmarks several times faster than regex-based counting even on long
+    submissions.
+
     This is the default counting function used by LengthPenalty.
     For more accurate token counting with a specific model, provide a custom
     count_fn that uses a tokenizer.
@@ -23,6 +114,44 @@ def word_count(text: str) -> int:
     return len(text.split())
 
 
+def make_tiktoken_count_fn(encoding_name: str = "cl100k_base") -> CountFn:
+    """Build a count_fn that counts tokens with a tiktoken encoding.
+
+    Token counts track model context usage far more accurately than word
+    counts, and tiktoken's Rust-backed encoder keeps the counting cheap.
+    Requires the optional tiktoken package.
+
+    Args:
+        encoding_name: Name of the tiktoken encoding to load.
+
+    Returns:
+        A count_fn suitable for LengthPenalty(count_fn=...).
+
+    Raises:
+        ImportError: If tiktoken is not installed.
+
+    Example:
+        >>> penalty = LengthPenalty(
+        ...     free_budget=8000,
+        ...     max_cap=10000,
+        ...     count_fn=make_tiktoken_count_fn("cl100k_base"),
+        ... )
+    """
+    try:
+        import tiktoken
+    except ImportError as e:
+        raise ImportError(
+            "tiktoken is required for make_tiktoken_count_fn. Install it with: pip install tiktoken"
+        ) from e
+
+    encoding = tiktoken.get_encoding(encoding_name)
+
+    def _count(text: str) -> int:
+        return len(encoding.encode_ordinary(text))
+
+    return _count
+
+
 def parse_thinking_output(text: str) -> ThinkingOutputDict:
     """Parse thinking and output sections from text with XML-style markers.
 
@@ -128,6 +257,22 @@ def compute_length_penalty(text: str | ThinkingOutputDict, config: LengthPenalty
     Returns:
         A penalty value between 0 and penalty_at_cap to subtract from the score.
     """
+    # Count tokens/words
+    count_fn = config.count_fn if config.count_fn is not None else word_count
+    count = count_fn(_select_text_to_count(text, config))
+
+    # Apply penalty curve
+    if count <= config.free_budget:
+        return 0.0
+    if count >= config.max_cap:
+        return config.penalty_at_cap
+
+    frac = (count - config.free_budget) / float(config.max_cap - config.free_budget)
+    return config.penalty_at_cap * (frac**config.exponent)
+
+
+def _select_text_to_count(text: str | ThinkingOutputDict, config: LengthPenalty) -> str:
+    """Select which sections of the text to count based on config.penalty_type."""
     # Normalize input to dict format
     if isinstance(text, str):
         # Backwards compatibility: treat string as output only
@@ -135,32 +280,180 @@ def compute_length_penalty(text: str | ThinkingOutputDict, config: LengthPenalty
     else:
         text_dict = text
 
-    # Select which text to count based on penalty_type
     if config.penalty_type == "ALL":
         # Concatenate both sections (with space to avoid word merging)
-        text_to_count = text_dict.get("thinking", "") + " " + text_dict.get("output", "")
+        return text_dict.get("thinking", "") + " " + text_dict.get("output", "")
     elif config.penalty_type == "OUTPUT_ONLY":
-        text_to_count = text_dict.get("output", "")
+        return text_dict.get("output", "")
     elif config.penalty_type == "THINKING_ONLY":
-        text_to_count = text_dict.get("thinking", "")
+        return text_dict.get("thinking", "")
     else:
         raise ValueError(
             f"Invalid penalty_type: {config.penalty_type}. "
             f"Must be 'ALL', 'OUTPUT_ONLY', or 'THINKING_ONLY'."
         )
 
-    # Count tokens/words
+
+def compute_length_penalty_batch(
+    texts: Sequence[str | ThinkingOutputDict], config: LengthPenalty
+) -> np.ndarray:
+    """Compute length penalties for a batch of texts in one vectorized pass.
+
+    Equivalent to calling compute_length_penalty on each text, but the penalty
+    curve (clamp, power, scale) is evaluated as NumPy array operations instead
+    of per-text Python arithmetic, which matters when grading thousands of
+    submissions at once.
+
+    Args:
+        texts: Submissions to count; each entry is a string or a dict with
+            'thinking' and 'output' keys, as for compute_length_penalty.
+        config: LengthPenalty configuration applied to every text.
+
+    Returns:
+        Array of penalties with one entry per text, each between 0 and
+        penalty_at_cap.
+    """
     count_fn = config.count_fn if config.count_fn is not None else word_count
-    count = count_fn(text_to_count)
+    counts = np.fromiter(
+        (count_fn(_select_text_to_count(text, config)) for text in texts),
+        dtype=np.int64,
+        count=len(texts),
+    )
 
-    # Apply penalty curve
-    if count <= config.free_budget:
-        return 0.0
-    if count >= config.max_cap:
-        return config.penalty_at_cap
+    if config.max_cap <= config.free_budget:
+        return np.where(counts > config.free_budget, config.penalty_at_cap, 0.0)
+
+    frac = np.clip(
+        (counts - config.free_budget) / float(config.max_cap - config.free_budget), 0.0, 1.0
+    )
+    return config.penalty_at_cap * frac**config.exponent
 
-    frac = (count - config.free_budget) / float(config.max_cap - config.free_budget)
-    return config.penalty_at_cap * (frac**config.exponent)
+
+# Precompiled validators for the fallback path below: reusing one TypeAdapter
+# per schema lets pydantic-core run its compiled validator directly instead of
+# re-resolving it through the class on every call.
+_PER_CRITERION_ADAPTER: TypeAdapter[PerCriterionOutput] = TypeAdapter(PerCriterionOutput)
+_ONESHOT_ADAPTER: TypeAdapter[OneShotOutput] = TypeAdapter(OneShotOutput)
+_RUBRIC_AS_JUDGE_ADAPTER: TypeAdapter[RubricAsJudgeOutput] = TypeAdapter(RubricAsJudgeOutput)
+
+_DEFAULT_MODEL = "gemini-3-pro-preview"
+
+
+@cache
+def _generate_config(schema: type[BaseModel]) -> types.GenerateContentConfig:
+    """Build (and cache) the request config template for one output schema.
+
+    Request configs are invariant apart from the per-call system prompt, so one
+    is built per schema on first use (the response schema is translated from
+    the Pydantic model here) instead of reconstructing per grading call.
+    Deferred so importing rubric doesn't pay for loading google-genai.
+    """
+    from google.genai import types
+
+    return types.GenerateContentConfig(
+        temperature=0,
+        response_mime_type="application/json",
+        response_schema=schema,
+    )
+
+
+def _is_retryable_error(exc: BaseException) -> bool:
+    """Return True for transient Gemini API failures worth retrying.
+
+    Covers server errors (5xx), rate limits (429), and transport-level
+    failures (connection resets, timeouts) raised by the underlying httpx
+    client; anything else — auth failures, invalid requests, schema
+    validation errors — fails fast. The error classes are imported lazily so
+    building a generate fn doesn't pull in google-genai at module import.
+    """
+    import httpx
+    from google.genai import errors
+
+    if isinstance(exc, errors.ServerError):
+        return True
+    if isinstance(exc, errors.ClientError):
+        return exc.code == 429
+    # TransportError covers httpx.TimeoutException and connection failures alike
+    return isinstance(exc, httpx.TransportError)
+
+
+def _make_generate_fn(
+    schema: type[BaseModel],
+    adapter: TypeAdapter,
+    model: str,
+    client: genai.Client | None,
+):
+    """Build a generate closure with the schema, adapter, and model prebound.
+
+    Everything invariant across calls is captured once here; per-call work is
+    limited to stamping the system prompt into the config template and issuing
+    the request. When client is None the shared module client is resolved
+    lazily so the closure tracks reset_client().
+
+    The request itself carries a bounded exponential-backoff retry (bound once
+    here, not per call) so a transient 429/5xx retries just the one failing
+    criterion call on the already-warm connection, instead of the caller
+    re-grading the whole rubric.
+    """
+
+    @retry(
+        stop=stop_after_attempt(4),
+        wait=wait_random_exponential(min=0.5, max=8),
+        retry=retry_if_exception(_is_retryable_error),
+        reraise=True,
+    )
+    async def _request(system_prompt: str, user_prompt: str):
+        config = _generate_config(schema)
+        return await (client or _get_client()).aio.models.generate_content(
+            model=model,
+            contents=user_prompt,
+            config=config.model_copy(update={"system_instruction": system_prompt}),
+        )
+
+    async def _generate(system_prompt: str, user_prompt: str, **kwargs):
+        response = await _request(system_prompt, user_prompt)
+        if (parsed := response.parsed) is not None:
+            return parsed
+        return adapter.validate_json(response.text or "")
+
+    return _generate
+
+
+def make_per_criterion_generate_fn(
+    model: str = _DEFAULT_MODEL, client: genai.Client | None = None
+) -> PerCriterionGenerateFn:
+    """Build a PerCriterionGrader generate function for a specific model/client.
+
+    The model name, client, request config, and output validator are bound into
+    the returned closure once, so per-call overhead is just the two prompt
+    strings. Pass a client to override the shared module-level one.
+    """
+    return _make_generate_fn(PerCriterionOutput, _PER_CRITERION_ADAPTER, model, client)
+
+
+def make_oneshot_generate_fn(
+    model: str = _DEFAULT_MODEL, client: genai.Client | None = None
+) -> OneShotGenerateFn:
+    """Build a PerCriterionOneShotGrader generate function for a specific model/client.
+
+    See make_per_criterion_generate_fn for the specialization details.
+    """
+    return _make_generate_fn(OneShotOutput, _ONESHOT_ADAPTER, model, client)
+
+
+def make_rubric_as_judge_generate_fn(
+    model: str = _DEFAULT_MODEL, client: genai.Client | None = None
+) -> RubricAsJudgeGenerateFn:
+    """Build a RubricAsJudgeGrader generate function for a specific model/client.
+
+    See make_per_criterion_generate_fn for the specialization details.
+    """
+    return _make_generate_fn(RubricAsJudgeOutput, _RUBRIC_AS_JUDGE_ADAPTER, model, client)
+
+
+_default_per_criterion_fn = make_per_criterion_generate_fn()
+_default_oneshot_fn = make_oneshot_generate_fn()
+_default_rubric_as_judge_fn = make_rubric_as_judge_generate_fn()
 
 
 async def default_per_criterion_generate_fn(
@@ -168,22 +461,14 @@ async def default_per_criterion_generate_fn(
 ) -> PerCriterionOutput:
     """Default generate function for PerCriterionGrader using Gemini API.
 
-    Calls Gemini with JSON schema for structured output and validates the response.
-    Users should implement their own generate functions with proper retry logic
-    and error handling tailored to their LLM client.
-    """
-    client = genai.Client(api_key=os.getenv("GEMINI_API_KEY"))
-    response = await client.aio.models.generate_content(
-        model="gemini-3-pro-preview",
-        contents=user_prompt,
-        config=types.GenerateContentConfig(
-            system_instruction=system_prompt,
-            temperature=0,
-            response_mime_type="application/json",
-            response_schema=PerCriterionOutput,
-        ),
-    )
-    return response.parsed
+    Calls Gemini with JSON schema for structured output. The SDK-parsed model
+    instance is returned directly (no redundant JSON decode or re-validation);
+    the precompiled TypeAdapter only runs if the SDK yields no parsed object.
+    Use make_per_criterion_generate_fn to target a different model or client.
+    Transient failures (429 rate limits, 5xx server errors) are retried with
+    bounded exponential backoff on the shared client before surfacing.
+    """
+    return await _default_per_criterion_fn(system_prompt, user_prompt, **kwargs)
 
 
 async def default_oneshot_generate_fn(
@@ -191,22 +476,14 @@ async def default_oneshot_generate_fn(
 ) -> OneShotOutput:
     """Default generate function for PerCriterionOneShotGrader using Gemini API.
 
-    Calls Gemini with JSON schema for structured output and validates the response.
-    Users should implement their own generate functions with proper retry logic
-    and error handling tailored to their LLM client.
-    """
-    client = genai.Client(api_key=os.getenv("GEMINI_API_KEY"))
-    response = await client.aio.models.generate_content(
-        model="gemini-3-pro-preview",
-        contents=user_prompt,
-        config=types.GenerateContentConfig(
-            system_instruction=system_prompt,
-            temperature=0,
-            response_mime_type="application/json",
-            response_schema=OneShotOutput,
-        ),
-    )
-    return response.parsed
+    Calls Gemini with JSON schema for structured output. The SDK-parsed model
+    instance is returned directly (no redundant JSON decode or re-validation);
+    the precompiled TypeAdapter only runs if the SDK yields no parsed object.
+    Use make_oneshot_generate_fn to target a different model or client.
+    Transient failures (429 rate limits, 5xx server errors) are retried with
+    bounded exponential backoff on the shared client before surfacing.
+    """
+    return await _default_oneshot_fn(system_prompt, user_prompt, **kwargs)
 
 
 async def default_rubric_as_judge_generate_fn(
@@ -214,19 +491,11 @@ async def default_rubric_as_judge_generate_fn(
 ) -> RubricAsJudgeOutput:
     """Default generate function for RubricAsJudgeGrader using Gemini API.
 
-    Calls Gemini with JSON schema for structured output and validates the response.
-    Users should implement their own generate functions with proper retry logic
-    and error handling tailored to their LLM client.
-    """
-    client = genai.Client(api_key=os.getenv("GEMINI_API_KEY"))
-    response = await client.aio.models.generate_content(
-        model="gemini-3-pro-preview",
-        contents=user_prompt,
-        config=types.GenerateContentConfig(
-            system_instruction=system_prompt,
-            temperature=0,
-            response_mime_type="application/json",
-            response_schema=RubricAsJudgeOutput,
-        ),
-    )
-    return response.parsed
+    Calls Gemini with JSON schema for structured output. The SDK-parsed model
+    instance is returned directly (no redundant JSON decode or re-validation);
+    the precompiled TypeAdapter only runs if the SDK yields no parsed object.
+    Use make_rubric_as_judge_generate_fn to target a different model or client.
+    Transient failures (429 rate limits, 5xx server errors) are retried with
+    bounded exponential backoff on the shared client before surfacing.
+    """
+    return await _default_rubric_as_judge_fn(system_prompt, user_prompt, **kwargs)
@@ -2,7 +2,7 @@ import pytest
 
 from rubric import Criterion, LengthPenalty, PerCriterionOutput, Rubric
 from rubric.autograders import PerCriterionGrader
-from rubric.utils import compute_length_penalty, word_count
+from rubric.utils import compute_length_penalty, compute_length_penalty_batch, word_count
 
 
 @pytest.fixture
@@ -250,3 +250,44 @@ class TestLengthPenaltyWithNegativeCriteria:
 
         assert result.raw_score == 5.0
         assert result.score == pytest.approx(-5.0)
+
+
+class TestLengthPenaltyBatch:
+    def test_batch_matches_scalar(self):
+        config = LengthPenalty(free_budget=100, max_cap=200, penalty_at_cap=50.0, exponent=1.6)
+        texts = [" ".join(["word"] * n) for n in (50, 100, 150, 200, 250)]
+
+        penalties = compute_length_penalty_batch(texts, config)
+
+        assert len(penalties) == len(texts)
+        for text, penalty in zip(texts, penalties):
+            assert penalty == pytest.approx(compute_length_penalty(text, config))
+
+    def test_batch_empty_input(self):
+        config = LengthPenalty(free_budget=100, max_cap=200, penalty_at_cap=50.0)
+        assert len(compute_length_penalty_batch([], config)) == 0
+
+    def test_batch_respects_penalty_type(self):
+        config = LengthPenalty(
+            free_budget=2, max_cap=4, penalty_at_cap=1.0, penalty_type="OUTPUT_ONLY"
+        )
+        texts = [
+            {"thinking": "very long thinking section here", "output": "short"},
+            {"thinking": "", "output": "one two three four five six"},
+        ]
+
+        penalties = compute_length_penalty_batch(texts, config)
+
+        assert penalties[0] == pytest.approx(0.0)
+        assert penalties[1] == pytest.approx(1.0)
+
+    def test_batch_custom_count_fn(self):
+        config = LengthPenalty(
+            free_budget=10,
+            max_cap=20,
+            penalty_at_cap=10.0,
+            count_fn=lambda text: len(text),
+        )
+        penalties = compute_length_penalty_batch(["a" * 5, "a" * 25], config)
+        assert penalties[0] == pytest.approx(0.0)
+        assert penalties[1] == pytest.approx(10.0)
@@ -1,11 +1,16 @@
+import asyncio
 import re
 
 import pytest
+from pydantic import ValidationError
 
 from rubric import Criterion, PerCriterionOutput, Rubric
 from rubric.autograders import PerCriterionGrader
 from rubric.types import EvaluationReport
 
+# Compiled once at module scope rather than per generate_fn invocation.
+TYPE_RE = re.compile(r"<criterion_type>(.*?)</criterion_type>", re.DOTALL)
+
 
 @pytest.mark.asyncio
 async def test_per_criterion_grader_class_integration(
@@ -31,9 +36,7 @@ async def test_per_criterion_grader_class_integration(
 @pytest.mark.asyncio
 async def test_per_criterion_grader_with_negative_criterion_unmet(sample_rubric):
     async def generate_with_issue(system_prompt: str, user_prompt: str) -> PerCriterionOutput:
-        criterion_type_match = re.search(
-            r"<criterion_type>(.*?)</criterion_type>", user_prompt, re.DOTALL
-        )
+        criterion_type_match = TYPE_RE.search(user_prompt)
         criterion_type = (
             criterion_type_match.group(1).strip().lower() if criterion_type_match else "positive"
         )
@@ -154,3 +157,254 @@ async def test_all_negative_criteria_with_different_weights():
     # score = 1.0 + (-1.0 / 3.0) = 2/3 ≈ 0.667
     assert result.score == pytest.approx(2.0 / 3.0)
     assert result.raw_score == pytest.approx(-1.0)
+
+
+@pytest.mark.asyncio
+async def test_auto_batch_uses_oneshot_path_at_threshold(
+    sample_rubric, sample_output, per_criterion_generate_fn, one_shot_generate_fn
+):
+    """With a oneshot fn configured, rubrics at the threshold are judged in one call."""
+    oneshot_calls = 0
+
+    async def counting_oneshot(system_prompt: str, user_prompt: str):
+        nonlocal oneshot_calls
+        oneshot_calls += 1
+        return await one_shot_generate_fn(system_prompt, user_prompt)
+
+    grader = PerCriterionGrader(
+        generate_fn=per_criterion_generate_fn,
+        oneshot_generate_fn=counting_oneshot,
+        auto_batch_threshold=4,
+    )
+
+    report = await sample_rubric.grade(sample_output, autograder=grader)
+
+    assert oneshot_calls == 1
+    assert report.score == pytest.approx(1.0)
+    assert report.report is not None
+    assert len(report.report) == len(sample_rubric.rubric)
+
+
+@pytest.mark.asyncio
+async def test_auto_batch_keeps_per_criterion_path_below_threshold(
+    sample_rubric, sample_output, per_criterion_generate_fn, one_shot_generate_fn
+):
+    """Below the threshold, the per-criterion fan-out is used and the oneshot fn is untouched."""
+
+    async def failing_oneshot(system_prompt: str, user_prompt: str):
+        raise AssertionError("oneshot path should not be used below the threshold")
+
+    grader = PerCriterionGrader(
+        generate_fn=per_criterion_generate_fn,
+        oneshot_generate_fn=failing_oneshot,
+        auto_batch_threshold=10,
+    )
+
+    report = await sample_rubric.grade(sample_output, autograder=grader)
+
+    assert report.score == pytest.approx(1.0)
+    assert [criterion.verdict for criterion in report.report] == ["MET", "MET", "MET", "UNMET"]
+
+
+@pytest.mark.asyncio
+async def test_auto_batch_forwards_oneshot_system_prompt(
+    sample_rubric, sample_output, per_criterion_generate_fn, one_shot_generate_fn
+):
+    """A custom oneshot_system_prompt reaches the one-shot call on the auto-batch path."""
+    seen_prompts = []
+
+    async def recording_oneshot(system_prompt: str, user_prompt: str):
+        seen_prompts.append(system_prompt)
+        return await one_shot_generate_fn(system_prompt, user_prompt)
+
+    grader = PerCriterionGrader(
+        generate_fn=per_criterion_generate_fn,
+        oneshot_generate_fn=recording_oneshot,
+        oneshot_system_prompt="Custom one-shot judge instructions",
+        auto_batch_threshold=4,
+    )
+
+    await sample_rubric.grade(sample_output, autograder=grader)
+
+    assert seen_prompts == ["Custom one-shot judge instructions"]
+
+
+@pytest.mark.asyncio
+async def test_grade_cache_skips_repeat_llm_calls(sample_rubric, sample_output):
+    """Grading an identical (submission, rubric, query) pair twice hits the cache."""
+    calls = 0
+
+    async def counting_generate(system_prompt: str, user_prompt: str) -> PerCriterionOutput:
+        nonlocal calls
+        calls += 1
+        return PerCriterionOutput(criterion_status="MET", explanation="Requirement met")
+
+    grader = PerCriterionGrader(generate_fn=counting_generate, cache={})
+
+    first = await sample_rubric.grade(sample_output, autograder=grader)
+    assert calls == len(sample_rubric.rubric)
+
+    second = await sample_rubric.grade(sample_output, autograder=grader)
+    assert calls == len(sample_rubric.rubric)  # no new LLM calls
+    assert second is first
+
+    # Reports are frozen and hold a tuple breakdown, so the shared cached
+    # instance cannot be poisoned by attribute or sequence mutation
+    with pytest.raises(ValidationError):
+        second.score = 0.0
+    assert isinstance(second.report, tuple)
+
+    # A different submission misses the cache and grades normally
+    await sample_rubric.grade("Different text entirely", autograder=grader)
+    assert calls == 2 * len(sample_rubric.rubric)
+
+
+@pytest.mark.asyncio
+async def test_grade_cache_keys_include_grader_config(sample_rubric, sample_output):
+    """Graders with different configurations can share one cache mapping without colliding."""
+    calls = 0
+
+    async def counting_generate(system_prompt: str, user_prompt: str) -> PerCriterionOutput:
+        nonlocal calls
+        calls += 1
+        return PerCriterionOutput(criterion_status="MET", explanation="Requirement met")
+
+    shared_cache: dict = {}
+    normalized = PerCriterionGrader(generate_fn=counting_generate, cache=shared_cache)
+    raw = PerCriterionGrader(generate_fn=counting_generate, cache=shared_cache, normalize=False)
+
+    first = await sample_rubric.grade(sample_output, autograder=normalized)
+    second = await sample_rubric.grade(sample_output, autograder=raw)
+
+    # The raw grader must not be served the normalized grader's report
+    assert calls == 2 * len(sample_rubric.rubric)
+    assert second.score != first.score
+
+
+@pytest.mark.asyncio
+async def test_grade_cache_distinguishes_query(sample_rubric, sample_output):
+    """The query is part of the cache key."""
+    calls = 0
+
+    async def counting_generate(system_prompt: str, user_prompt: str) -> PerCriterionOutput:
+        nonlocal calls
+        calls += 1
+        return PerCriterionOutput(criterion_status="MET", explanation="Requirement met")
+
+    grader = PerCriterionGrader(generate_fn=counting_generate, cache={})
+
+    await sample_rubric.grade(sample_output, autograder=grader, query="What is the capital?")
+    await sample_rubric.grade(sample_output, autograder=grader, query="Name a French city")
+
+    assert calls == 2 * len(sample_rubric.rubric)
+
+
+@pytest.mark.asyncio
+async def test_score_threshold_cancels_undecidable_criteria():
+    """Once the threshold outcome is decided, pending criterion calls are cancelled."""
+    rubric = Rubric(
+        [
+            Criterion(weight=1.0, requirement="Fast criterion"),
+            Criterion(weight=1.0, requirement="Slow criterion"),
+        ]
+    )
+
+    async def generate(system_prompt: str, user_prompt: str) -> PerCriterionOutput:
+        if "Fast criterion" in user_prompt:
+            return PerCriterionOutput(criterion_status="MET", explanation="Requirement met")
+        await asyncio.sleep(30)  # cancelled long before completing
+        return PerCriterionOutput(criterion_status="MET", explanation="Requirement met")
+
+    grader = PerCriterionGrader(generate_fn=generate, score_threshold=0.4)
+
+    # After the fast criterion lands MET, min possible score is 0.5 >= 0.4,
+    # so the slow criterion is cancelled and reported as not evaluated.
+    result = await asyncio.wait_for(rubric.grade("text", autograder=grader), timeout=5)
+
+    assert result.score >= 0.4
+    reasons = [r.reason for r in result.report]
+    assert any("Not evaluated" in reason for reason in reasons)
+
+
+@pytest.mark.asyncio
+async def test_score_threshold_fails_fast_when_unreachable():
+    """A heavy UNMET criterion makes the threshold unreachable and skips the rest."""
+    rubric = Rubric(
+        [
+            Criterion(weight=9.0, requirement="Fast criterion"),
+            Criterion(weight=1.0, requirement="Slow criterion"),
+        ]
+    )
+
+    async def generate(system_prompt: str, user_prompt: str) -> PerCriterionOutput:
+        if "Fast criterion" in user_prompt:
+            return PerCriterionOutput(criterion_status="UNMET", explanation="Missing")
+        await asyncio.sleep(30)
+        return PerCriterionOutput(criterion_status="MET", explanation="Requirement met")
+
+    grader = PerCriterionGrader(generate_fn=generate, score_threshold=0.9)
+
+    # Max possible score after the UNMET is 1/10 = 0.1 < 0.9.
+    result = await asyncio.wait_for(rubric.grade("text", autograder=grader), timeout=5)
+
+    assert result.score < 0.9
+    reasons = [r.reason for r in result.report]
+    assert any("Not evaluated" in reason for reason in reasons)
+
+
+@pytest.mark.asyncio
+async def test_score_threshold_completes_all_criteria_when_undecided(
+    sample_rubric, sample_output, per_criterion_generate_fn
+):
+    """With no early decision possible, every criterion is still evaluated."""
+    grader = PerCriterionGrader(generate_fn=per_criterion_generate_fn, score_threshold=1.0)
+
+    result = await sample_rubric.grade(sample_output, autograder=grader)
+
+    assert result.score == pytest.approx(1.0)
+    assert all("Not evaluated" not in r.reason for r in result.report)
+
+
+@pytest.mark.asyncio
+async def test_grade_many_returns_reports_in_order(sample_criteria):
+    async def generate(system_prompt: str, user_prompt: str) -> PerCriterionOutput:
+        response_section = user_prompt.split("<response>")[-1]
+        if "Paris" in response_section:
+            return PerCriterionOutput(criterion_status="MET", explanation="Requirement met")
+        return PerCriterionOutput(criterion_status="UNMET", explanation="Requirement not met")
+
+    grader = PerCriterionGrader(generate_fn=generate)
+    items = [
+        ("Paris is the capital of France. A beautiful, historic city.", sample_criteria),
+        ("Nothing relevant here.", sample_criteria, "What is the capital of France?"),
+    ]
+
+    reports = await grader.grade_many(items)
+
+    assert len(reports) == 2
+    assert reports[0].score > reports[1].score
+    assert reports[1].score == pytest.approx(0.0)
+    assert all(len(report.report) == len(sample_criteria) for report in reports)
+
+
+@pytest.mark.asyncio
+async def test_grade_many_bounds_concurrent_submissions(sample_criteria):
+    in_flight = 0
+    max_in_flight = 0
+
+    async def generate(system_prompt: str, user_prompt: str) -> PerCriterionOutput:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return PerCriterionOutput(criterion_status="MET", explanation="Requirement met")
+
+    grader = PerCriterionGrader(generate_fn=generate)
+    items = [(f"submission {i}", sample_criteria) for i in range(8)]
+
+    reports = await grader.grade_many(items, concurrency=2)
+
+    assert len(reports) == 8
+    # At most 2 submissions x 4 criteria in flight at any point
+    assert max_in_flight <= 2 * len(sample_criteria)
@@ -1,5 +1,6 @@
 import re
 from collections.abc import Awaitable, Callable
+from types import MappingProxyType
 
 import pytest
 from dotenv import load_dotenv
@@ -10,9 +11,14 @@ from rubric import (
     PerCriterionOutput,
     Rubric,
     RubricAsJudgeOutput,
+    use_uvloop,
 )
 from rubric.autograders.schemas import CriterionEvaluation
 
+# Run the suite under uvloop when it's installed, matching production setups
+# that call use_uvloop(). Must happen before pytest-asyncio creates any loop.
+use_uvloop()
+
 CriterionList = list[Criterion]
 PerCriterionGenerateFn = Callable[[str, str], Awaitable[PerCriterionOutput]]
 OneShotGenerateFn = Callable[[str, str], Awaitable[OneShotOutput]]
@@ -20,6 +26,24 @@ RubricAsJudgeGenerateFn = Callable[[str, str], Awaitable[RubricAsJudgeOutput]]
 
 load_dotenv()
 
+# Compiled once at module scope so fixture invocations (and test modules) reuse
+# the same patterns and frozen lookup data instead of rebuilding them per test.
+CRITERION_RE = re.compile(r"<criterion>(.*?)</criterion>", re.DOTALL)
+TYPE_RE = re.compile(r"<criterion_type>(.*?)</criterion_type>", re.DOTALL)
+
+POSITIVE_REQUIREMENTS_MET = frozenset(
+    {
+        "Output mentions Paris",
+        "Output mentions France",
+        "Output is written in complete sentences",
+    }
+)
+NEGATIVE_ERRORS_PRESENT = MappingProxyType(
+    {
+        "Output contains profanity or offensive language": False,  # Error NOT present
+    }
+)
+
 
 @pytest.fixture
 def sample_output() -> str:
@@ -62,25 +86,14 @@ def _extract_field(pattern: re.Pattern[str], text: str) -> str:
 
 @pytest.fixture
 def per_criterion_generate_fn() -> PerCriterionGenerateFn:
-    criterion_pattern = re.compile(r"<criterion>(.*?)</criterion>", re.DOTALL)
-    type_pattern = re.compile(r"<criterion_type>(.*?)</criterion_type>", re.DOTALL)
-    positive_requirements_met = {
-        "Output mentions Paris",
-        "Output mentions France",
-        "Output is written in complete sentences",
-    }
-    negative_errors_present = {
-        "Output contains profanity or offensive language": False,  # Error NOT present
-    }
-
     async def _generate(system_prompt: str, user_prompt: str) -> PerCriterionOutput:
-        criterion_text = _extract_field(criterion_pattern, user_prompt)
-        criterion_type = _extract_field(type_pattern, user_prompt).lower()
+        criterion_text = _extract_field(CRITERION_RE, user_prompt)
+        criterion_type = _extract_field(TYPE_RE, user_prompt).lower()
 
         if criterion_type == "negative":
             # For negative criteria: criterion_status="MET" means error IS present (bad)
             # criterion_status="UNMET" means error is NOT present (good)
-            error_present = negative_errors_present.get(criterion_text, False)
+            error_present = NEGATIVE_ERRORS_PRESENT.get(criterion_text, False)
             explanation = (
                 "Error detected in the output."
                 if error_present
@@ -91,7 +104,7 @@ def per_criterion_generate_fn() -> PerCriterionGenerateFn:
                 explanation=explanation,
             )
 
-        criteria_met = criterion_text in positive_requirements_met
+        criteria_met = criterion_text in POSITIVE_REQUIREMENTS_MET
         explanation = (
             "Requirement satisfied by the submission."
             if criteria_met
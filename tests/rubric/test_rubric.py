@@ -1,3 +1,5 @@
+import gc
+
 import pytest
 
 from rubric import Criterion, Rubric
@@ -97,3 +99,57 @@ async def test_rubric(per_criterion_generate_fn):
                 f"Item {idx + 1}: Invalid formatting verdict {criterion.verdict}"
             )
             assert criterion.reason, f"Item {idx + 1}: Missing reason for formatting criterion"
+
+
+def test_rubric_precomputes_weight_totals():
+    rubric = Rubric(
+        [
+            Criterion(weight=10.0, requirement="Contains greeting"),
+            Criterion(weight=5.0, requirement="Contains farewell"),
+            Criterion(weight=-3.0, requirement="Contains profanity"),
+        ]
+    )
+
+    assert rubric.total_positive_weight == pytest.approx(15.0)
+    assert rubric.total_negative_weight == pytest.approx(3.0)
+
+
+def test_rubric_weight_totals_all_negative():
+    rubric = Rubric(
+        [
+            Criterion(weight=-2.0, requirement="Contains factual errors"),
+            Criterion(weight=-1.0, requirement="Contains typos"),
+        ]
+    )
+
+    assert rubric.total_positive_weight == pytest.approx(0.0)
+    assert rubric.total_negative_weight == pytest.approx(3.0)
+
+
+def test_criterion_intern_returns_canonical_instance():
+    first = Criterion.intern(2.0, "Response cites a source")
+    second = Criterion.intern(2.0, "Response cites a source")
+    other = Criterion.intern(3.0, "Response cites a source")
+
+    assert first is second
+    assert first == Criterion(weight=2.0, requirement="Response cites a source")
+    assert other is not first
+
+
+def test_rubric_construction_interns_criteria():
+    data = [{"weight": 1.0, "requirement": "Mentions the deadline"}]
+
+    rubric_a = Rubric.from_dict(data)
+    rubric_b = Rubric.from_dict(data)
+
+    assert rubric_a.rubric[0] is rubric_b.rubric[0]
+
+
+def test_criterion_intern_releases_unreferenced_entries():
+    from rubric.types import _criterion_intern
+
+    key = (7.0, "Ephemeral requirement nothing holds onto")
+    Criterion.intern(*key)
+    gc.collect()
+
+    assert key not in _criterion_intern